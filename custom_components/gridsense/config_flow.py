@@ -18,6 +18,8 @@ from .coordinator import async_fetch_devices
 
 _LOGGER = logging.getLogger(__name__)
 
+_GATEWAY_ID_RE = re.compile(r"^gridsense-([a-zA-Z0-9]+)-homeassistant")
+
 
 class GridSenseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for GridSense."""
@@ -41,14 +43,6 @@ class GridSenseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return self.async_abort(reason="already_configured")
             result = await self._async_validate_host(host)
             if result is None:
-                if self._discovered_unique_id:
-                    await self.async_set_unique_id(self._discovered_unique_id)
-                    existing_entry = self._async_get_entry_by_unique_id(
-                        self._discovered_unique_id
-                    )
-                    if existing_entry:
-                        await self._async_update_entry_host(existing_entry, host)
-                        return self.async_abort(reason="already_configured")
                 gateway_identifier = self._gateway_identifier(host)
                 title = f"GridSense Gateway {gateway_identifier}"
                 return self.async_create_entry(title=title, data={CONF_HOST: host})
@@ -64,29 +58,26 @@ class GridSenseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle discovery from mDNS."""
         host = discovery_info.host
-        mdns_name = _normalize_mdns_name(discovery_info.hostname) or _normalize_mdns_name(
-            discovery_info.name
-        )
-        self._discovered_gateway_id = _extract_gateway_id(mdns_name)
         self._discovered_gateway_uuid = _extract_uuid_from_zeroconf(discovery_info)
         self._discovered_unique_id = self._discovered_gateway_uuid
         self._discovered_host = host
-        self._discovered_name = mdns_name
 
         if not self._discovered_unique_id:
             _LOGGER.debug("No UUID found in mDNS TXT records for %s", host)
             return self.async_abort(reason="no_uuid")
 
         await self.async_set_unique_id(self._discovered_unique_id)
-        existing_entry = self._async_get_entry_by_unique_id(self._discovered_unique_id)
-        if existing_entry:
-            await self._async_update_entry_host(existing_entry, host)
-            return self.async_abort(reason="already_configured")
+        self._abort_if_unique_id_configured(updates={CONF_HOST: host})
         existing_host_entry = self._async_get_entry_by_host(host)
         if existing_host_entry and existing_host_entry.unique_id != self._discovered_unique_id:
             self._async_update_entry_unique_id(existing_host_entry, self._discovered_unique_id)
             return self.async_abort(reason="already_configured")
 
+        mdns_name = _normalize_mdns_name(discovery_info.hostname) or _normalize_mdns_name(
+            discovery_info.name
+        )
+        self._discovered_gateway_id = _extract_gateway_id(mdns_name)
+        self._discovered_name = mdns_name
         gateway_identifier = self._gateway_identifier(host)
         self.context["title_placeholders"] = {"host": host, "name": gateway_identifier}
         return await self.async_step_confirm()
@@ -94,7 +85,13 @@ class GridSenseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_confirm(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Confirm adding the discovered device."""
         if user_input is not None:
-            return await self.async_step_user({CONF_HOST: self._discovered_host})
+            host = self._discovered_host
+            # An entry for this gateway may have been added since discovery.
+            self._abort_if_unique_id_configured(updates={CONF_HOST: host})
+            if self._async_get_entry_by_host(host):
+                return self.async_abort(reason="already_configured")
+            title = f"GridSense Gateway {self._gateway_identifier(host)}"
+            return self.async_create_entry(title=title, data={CONF_HOST: host})
 
         return self.async_show_form(
             step_id="confirm",
@@ -129,27 +126,12 @@ class GridSenseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return extracted
         return host
 
-    def _async_get_entry_by_unique_id(self, unique_id: str) -> config_entries.ConfigEntry | None:
-        for entry in self._async_current_entries():
-            if entry.unique_id == unique_id:
-                return entry
-        return None
-
     def _async_get_entry_by_host(self, host: str) -> config_entries.ConfigEntry | None:
         for entry in self._async_current_entries():
             if entry.data.get(CONF_HOST) == host:
                 return entry
         return None
 
-    async def _async_update_entry_host(
-        self, entry: config_entries.ConfigEntry, host: str
-    ) -> None:
-        if entry.data.get(CONF_HOST) == host:
-            return
-        updated = {**entry.data, CONF_HOST: host}
-        self.hass.config_entries.async_update_entry(entry, data=updated)
-        await self.hass.config_entries.async_reload(entry.entry_id)
-
     def _async_update_entry_unique_id(
         self, entry: config_entries.ConfigEntry, unique_id: str
     ) -> None:
@@ -166,13 +148,10 @@ def _normalize_mdns_name(name: str | None) -> str | None:
 
 
 def _extract_gateway_id(mdns_name: str | None) -> str | None:
-    """Extract the short gateway identifier from an mDNS hostname."""
+    """Extract the short gateway identifier from a normalized mDNS hostname."""
     if not mdns_name:
         return None
-    normalized = _normalize_mdns_name(mdns_name)
-    if normalized is None:
-        return None
-    match = re.match(r"^gridsense-([a-zA-Z0-9]+)-homeassistant", normalized.lower())
+    match = _GATEWAY_ID_RE.match(mdns_name.lower())
     if match:
         return match.group(1)
     return None
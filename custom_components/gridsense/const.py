@@ -8,4 +8,36 @@ DEFAULT_SCAN_INTERVAL = 30
 
 CONF_HOST = "host"
 
+# Numeric device fields read by the sensor platform.
+FIELD_POWER_AC = "powerAc"
+FIELD_POWER_DC = "powerDc"
+FIELD_POWER_DC_PV_TOTAL = "powerDcPvTotal"
+FIELD_TOTAL_ENERGY_INJECTED = "totalEnergyInjected"
+FIELD_TEMPERATURE_HEATSINK = "temperatureHeatsink"
+FIELD_SOE = "soe"
+FIELD_AVAILABLE_ENERGY = "availableEnergy"
+FIELD_TOTAL_ENERGY_CHARGED = "totalEnergyCharged"
+FIELD_TOTAL_ENERGY_DISCHARGED = "totalEnergyDischarged"
+FIELD_TOTAL_IMPORT_AC = "totalImportAc"
+FIELD_TOTAL_EXPORT_AC = "totalExportAc"
+
+# Numeric fields per payload section; the coordinator coerces these on refresh.
+NUMERIC_FIELDS: dict[str, tuple[str, ...]] = {
+    "inverters": (
+        FIELD_POWER_AC,
+        FIELD_POWER_DC,
+        FIELD_POWER_DC_PV_TOTAL,
+        FIELD_TOTAL_ENERGY_INJECTED,
+        FIELD_TEMPERATURE_HEATSINK,
+    ),
+    "batteries": (
+        FIELD_POWER_DC,
+        FIELD_SOE,
+        FIELD_AVAILABLE_ENERGY,
+        FIELD_TOTAL_ENERGY_CHARGED,
+        FIELD_TOTAL_ENERGY_DISCHARGED,
+    ),
+    "energyMeters": (FIELD_POWER_AC, FIELD_TOTAL_IMPORT_AC, FIELD_TOTAL_EXPORT_AC),
+}
+
 PLATFORMS: list[Platform] = [Platform.SENSOR]
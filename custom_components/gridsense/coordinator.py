@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from datetime import timedelta
+import json
 import logging
 from typing import Any
 
@@ -12,22 +13,40 @@ import async_timeout
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+import orjson
 
-from .const import DEFAULT_PORT, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import DEFAULT_PORT, DEFAULT_SCAN_INTERVAL, DOMAIN, NUMERIC_FIELDS
 
 _LOGGER = logging.getLogger(__name__)
 
+_MAX_PAYLOAD_SIZE = 1_000_000
+_REQUEST_HEADERS = {"Accept": "application/json", "Connection": "keep-alive"}
+
+
+def _devices_url(host: str) -> str:
+    """Return the devices endpoint URL for a GridSense Gateway."""
+    return f"http://{host}:{DEFAULT_PORT}/api/v1/devices"
+
 
 async def async_fetch_devices(
-    session: ClientSession, host: str, *, timeout: float = 15.0
+    session: ClientSession,
+    host: str,
+    *,
+    timeout: float = 15.0,
+    url: str | None = None,
 ) -> dict[str, Any]:
     """Fetch device data from the GridSense Gateway."""
-    url = f"http://{host}:{DEFAULT_PORT}/api/v1/devices"
+    if url is None:
+        url = _devices_url(host)
     try:
         async with async_timeout.timeout(timeout):
-            response = await session.get(url)
+            response = await session.get(url, headers=_REQUEST_HEADERS)
             response.raise_for_status()
-            payload = await response.json()
+            if (response.content_length or 0) > _MAX_PAYLOAD_SIZE:
+                response.close()
+                raise UpdateFailed(f"Payload from GridSense Gateway at {host} is too large")
+            raw = await response.read()
+        payload = _loads(raw)
     except asyncio.TimeoutError as err:
         raise UpdateFailed(f"GridSense Gateway at {host} timed out") from err
     except ClientError as err:
@@ -38,6 +57,8 @@ async def async_fetch_devices(
     if not isinstance(payload, dict):
         raise UpdateFailed("Unexpected payload from GridSense Gateway")
 
+    if not _needs_sanitizing(raw):
+        return payload
     return _sanitize_payload(payload)
 
 
@@ -47,6 +68,7 @@ class GridSenseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def __init__(self, hass: HomeAssistant, host: str) -> None:
         """Initialize the coordinator."""
         self.host = host
+        self._url = _devices_url(host)
         self._session = async_get_clientsession(hass)
 
         super().__init__(
@@ -58,15 +80,86 @@ class GridSenseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from the API endpoint."""
-        return await async_fetch_devices(self._session, self.host)
+        payload = await async_fetch_devices(self._session, self.host, url=self._url)
+        _coerce_numeric_fields(payload)
+        return payload
+
+
+def _coerce_numeric_fields(payload: dict[str, Any]) -> None:
+    """Convert the numeric sensor fields of every device to a number or None in place."""
+    for section, fields in NUMERIC_FIELDS.items():
+        devices_by_inverter = payload.get(section)
+        if not isinstance(devices_by_inverter, dict):
+            continue
+        for devices in devices_by_inverter.values():
+            if isinstance(devices, dict):
+                devices = (devices,)
+            elif not isinstance(devices, list):
+                continue
+            for device in devices:
+                if not isinstance(device, dict):
+                    continue
+                for field in fields:
+                    device[field] = _try_float(device.get(field))
+
+
+def _try_float(value: Any) -> float | int | None:
+    """Convert a value to float when possible."""
+    value_type = type(value)
+    if value_type is float or value_type is int:
+        return value
+    if value_type is str:
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse a JSON body, accepting NaN and Infinity like the stdlib parser."""
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # orjson rejects NaN, Infinity and out-of-range numbers such as 1e999.
+        return json.loads(raw)
+
+
+def _needs_sanitizing(raw: bytes) -> bool:
+    """Return True if the raw body carries null padding inside strings.
+
+    JSON can only carry NUL inside a string as the \\u0000 escape; a raw NUL
+    byte is rejected by the parser before this check runs.
+    """
+    return b"\\u0000" in raw
 
 
 def _sanitize_payload(value: Any) -> Any:
-    """Recursively remove null padding and strip whitespace."""
-    if isinstance(value, dict):
-        return {key: _sanitize_payload(item) for key, item in value.items()}
-    if isinstance(value, list):
-        return [_sanitize_payload(item) for item in value]
+    """Remove null padding and strip whitespace from strings in place."""
     if isinstance(value, str):
-        return value.replace("\x00", "").strip()
+        return _sanitize_string(value)
+
+    stack: list[Any] = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            items = node.items()
+        elif isinstance(node, list):
+            items = enumerate(node)
+        else:
+            continue
+        for key, item in items:
+            if isinstance(item, str):
+                cleaned = _sanitize_string(item)
+                if cleaned is not item:
+                    node[key] = cleaned
+            elif isinstance(item, (dict, list)):
+                stack.append(item)
     return value
+
+
+def _sanitize_string(value: str) -> str:
+    """Return the string without null padding and surrounding whitespace."""
+    if "\x00" not in value and not (value[:1].isspace() or value[-1:].isspace()):
+        return value
+    return value.replace("\x00", "").strip()
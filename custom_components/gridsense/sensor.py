@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import methodcaller
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -14,14 +15,30 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfEnergy, UnitOfPower, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    FIELD_AVAILABLE_ENERGY,
+    FIELD_POWER_AC,
+    FIELD_POWER_DC,
+    FIELD_POWER_DC_PV_TOTAL,
+    FIELD_SOE,
+    FIELD_TEMPERATURE_HEATSINK,
+    FIELD_TOTAL_ENERGY_CHARGED,
+    FIELD_TOTAL_ENERGY_DISCHARGED,
+    FIELD_TOTAL_ENERGY_INJECTED,
+    FIELD_TOTAL_EXPORT_AC,
+    FIELD_TOTAL_IMPORT_AC,
+)
 from .coordinator import GridSenseDataUpdateCoordinator
 
+# Shared read-only fallback for missing payload sections; never mutate.
+_EMPTY: dict[str, Any] = {}
+
 
 @dataclass
 class GridSenseSensorEntityDescription(SensorEntityDescription):
@@ -33,6 +50,10 @@ class GridSenseSensorEntityDescription(SensorEntityDescription):
 class GridSenseSensor(CoordinatorEntity[GridSenseDataUpdateCoordinator], SensorEntity):
     """Representation of a GridSense sensor."""
 
+    # The Home Assistant base classes keep a __dict__; slotting our own
+    # per-entity fields still gives them direct descriptor access.
+    __slots__ = ("_data_getter",)
+
     _attr_has_entity_name = True
 
     def __init__(
@@ -51,23 +72,51 @@ class GridSenseSensor(CoordinatorEntity[GridSenseDataUpdateCoordinator], SensorE
         self._attr_unique_id = unique_id
         self._data_getter = data_getter
         self._attr_name = description.name or device_name
-        # Explicitly expose unit/device/state classes to ensure UI shows units.
-        self._attr_native_unit_of_measurement = description.native_unit_of_measurement
-        self._attr_device_class = description.device_class
-        self._attr_state_class = description.state_class
+        self._update_from_coordinator()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Resolve value and availability, then write state."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
 
     @property
     def available(self) -> bool:
         """Return entity availability."""
-        return super().available and self._data_getter(self.coordinator.data or {}) is not None
-
-    @property
-    def native_value(self) -> float | int | None:
-        """Return the sensor value."""
-        data = self._data_getter(self.coordinator.data or {})
-        if data is None or self.entity_description.value_fn is None:
+        # CoordinatorEntity overrides `available`, so _attr_available needs re-exposing.
+        return self._attr_available
+
+    def _update_from_coordinator(self) -> None:
+        """Resolve this sensor's value from the current coordinator payload."""
+        payload = self.coordinator.data
+        data = self._data_getter(payload if payload is not None else _EMPTY)
+        value_fn = self.entity_description.value_fn
+        if data is None or value_fn is None:
+            self._attr_native_value = None
+        else:
+            self._attr_native_value = value_fn(data)
+        self._attr_available = data is not None and self.coordinator.last_update_success
+
+
+class _KwhValue:
+    """Read a watt-hours field and return it in kiloWatt-hours."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: str) -> None:
+        """Initialize the value reader."""
+        self.key = key
+
+    def __call__(self, data: dict[str, Any]) -> float | None:
+        """Return the field value in kiloWatt-hours."""
+        value = data.get(self.key)
+        if value is None:
             return None
-        return self.entity_description.value_fn(data)
+        return value / 1000
+
+    def __repr__(self) -> str:
+        """Return the field this reader converts."""
+        return f"{type(self).__name__}({self.key!r})"
 
 
 INVERTER_SENSORS: tuple[GridSenseSensorEntityDescription, ...] = (
@@ -77,7 +126,7 @@ INVERTER_SENSORS: tuple[GridSenseSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         native_unit_of_measurement=UnitOfPower.WATT,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: _try_float(data.get("powerAc")),
+        value_fn=methodcaller("get", FIELD_POWER_AC),
     ),
     GridSenseSensorEntityDescription(
         key="power_dc",
@@ -85,7 +134,7 @@ INVERTER_SENSORS: tuple[GridSenseSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         native_unit_of_measurement=UnitOfPower.WATT,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: _try_float(data.get("powerDc")),
+        value_fn=methodcaller("get", FIELD_POWER_DC),
     ),
     GridSenseSensorEntityDescription(
         key="power_dc_pv_total",
@@ -93,7 +142,7 @@ INVERTER_SENSORS: tuple[GridSenseSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         native_unit_of_measurement=UnitOfPower.WATT,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: _try_float(data.get("powerDcPvTotal")),
+        value_fn=methodcaller("get", FIELD_POWER_DC_PV_TOTAL),
     ),
     GridSenseSensorEntityDescription(
         key="energy_injected_total",
@@ -101,14 +150,14 @@ INVERTER_SENSORS: tuple[GridSenseSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda data: _to_kwh(data.get("totalEnergyInjected")),
+        value_fn=_KwhValue(FIELD_TOTAL_ENERGY_INJECTED),
     ),
     GridSenseSensorEntityDescription(
         key="heatsink_temperature",
         name="Heatsink Temperature",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: _try_float(data.get("temperatureHeatsink")),
+        value_fn=methodcaller("get", FIELD_TEMPERATURE_HEATSINK),
     ),
 )
 
@@ -120,7 +169,7 @@ BATTERY_SENSORS: tuple[GridSenseSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         native_unit_of_measurement=UnitOfPower.WATT,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: _try_float(data.get("powerDc")),
+        value_fn=methodcaller("get", FIELD_POWER_DC),
     ),
     GridSenseSensorEntityDescription(
         key="state_of_energy",
@@ -128,14 +177,14 @@ BATTERY_SENSORS: tuple[GridSenseSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.BATTERY,
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: _to_percentage(data.get("soe")),
+        value_fn=methodcaller("get", FIELD_SOE),
     ),
     GridSenseSensorEntityDescription(
         key="available_energy",
         name="Available Energy",
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        value_fn=lambda data: _to_kwh(data.get("availableEnergy")),
+        value_fn=_KwhValue(FIELD_AVAILABLE_ENERGY),
     ),
     GridSenseSensorEntityDescription(
         key="total_energy_charged",
@@ -143,7 +192,7 @@ BATTERY_SENSORS: tuple[GridSenseSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda data: _to_kwh(data.get("totalEnergyCharged")),
+        value_fn=_KwhValue(FIELD_TOTAL_ENERGY_CHARGED),
     ),
     GridSenseSensorEntityDescription(
         key="total_energy_discharged",
@@ -151,7 +200,7 @@ BATTERY_SENSORS: tuple[GridSenseSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda data: _to_kwh(data.get("totalEnergyDischarged")),
+        value_fn=_KwhValue(FIELD_TOTAL_ENERGY_DISCHARGED),
     ),
 )
 
@@ -163,7 +212,7 @@ GRID_METER_SENSORS: tuple[GridSenseSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         native_unit_of_measurement=UnitOfPower.WATT,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: _try_float(data.get("powerAc")),
+        value_fn=methodcaller("get", FIELD_POWER_AC),
     ),
     GridSenseSensorEntityDescription(
         key="grid_import_total",
@@ -171,7 +220,7 @@ GRID_METER_SENSORS: tuple[GridSenseSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda data: _to_kwh(data.get("totalImportAc")),
+        value_fn=_KwhValue(FIELD_TOTAL_IMPORT_AC),
     ),
     GridSenseSensorEntityDescription(
         key="grid_export_total",
@@ -179,7 +228,7 @@ GRID_METER_SENSORS: tuple[GridSenseSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda data: _to_kwh(data.get("totalExportAc")),
+        value_fn=_KwhValue(FIELD_TOTAL_EXPORT_AC),
     ),
 )
 
@@ -188,27 +237,32 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up GridSense sensors based on a config entry."""
-    coordinator: GridSenseDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    domain = DOMAIN
+    coordinator: GridSenseDataUpdateCoordinator = hass.data[domain][entry.entry_id]
 
     entities: list[GridSenseSensor] = []
     data = coordinator.data or {}
-    inverters = list((data.get("inverters") or {}).values())
+    inverters = data.get("inverters") or {}
+    batteries = data.get("batteries") or {}
+    meters = data.get("energyMeters") or {}
 
-    for inverter in inverters:
+    for inverter_key, inverter in inverters.items():
         inverter_manufacturer = _identifier(inverter.get("manufacturer"), "unknown_manufacturer")
         inverter_serial = _identifier(inverter.get("serialNumber"), "unknown_serial")
         if not inverter_serial:
             continue
         inverter_model = inverter.get("model") or "Inverter"
         inverter_name = _device_name(inverter_manufacturer or "GridSense", inverter_model)
+        inverter_identifier = (domain, f"inverter_{inverter_manufacturer}_{inverter_serial}")
 
-        inverter_device = DeviceInfo(
-            identifiers={(DOMAIN, f"inverter_{inverter_manufacturer}_{inverter_serial}")},
-            manufacturer=inverter_manufacturer or "GridSense",
-            model=inverter_model,
-            name=inverter_name,
-            sw_version=inverter.get("version"),
-        )
+        inverter_getter = _InverterGetter(inverter_key, inverter_manufacturer, inverter_serial)
+        inverter_device: DeviceInfo = {
+            "identifiers": {inverter_identifier},
+            "manufacturer": inverter_manufacturer or "GridSense",
+            "model": inverter_model,
+            "name": inverter_name,
+            "sw_version": inverter.get("version"),
+        }
 
         for description in INVERTER_SENSORS:
             entities.append(
@@ -218,30 +272,28 @@ async def async_setup_entry(
                     unique_id=f"inverter_{inverter_manufacturer}_{inverter_serial}_{description.key}",
                     description=description,
                     device_info=inverter_device,
-                    data_getter=lambda payload, inv_man=inverter_manufacturer, inv_serial=inverter_serial: _find_inverter(
-                        payload, inv_man, inv_serial
-                    ),
+                    data_getter=inverter_getter,
                 )
             )
 
-        for index, battery in enumerate(
-            _find_batteries_for_inverter(data, inverter_manufacturer, inverter_serial)
-        ):
+        for index, battery in enumerate(batteries.get(inverter_key) or []):
             battery_manufacturer = _identifier(battery.get("manufacturer"), "unknown_manufacturer")
-            battery_serial = _identifier(
-                battery.get("serialNumber"), f"{inverter_serial}_b{index}"
-            )
+            battery_lookup_serial = _identifier(battery.get("serialNumber")) or None
+            battery_serial = battery_lookup_serial or f"{inverter_serial}_b{index}"
             battery_model = battery.get("model") or "Battery"
             battery_name = _device_name(battery_manufacturer or "GridSense", battery_model)
 
-            battery_device = DeviceInfo(
-                identifiers={(DOMAIN, f"battery_{battery_manufacturer}_{battery_serial}")},
-                manufacturer=battery_manufacturer or "GridSense",
-                model=battery_model,
-                name=battery_name,
-                sw_version=battery.get("version"),
-                via_device=(DOMAIN, f"inverter_{inverter_manufacturer}_{inverter_serial}"),
+            battery_getter = _AttachedDeviceGetter(
+                "batteries", inverter_getter, battery_lookup_serial, index
             )
+            battery_device: DeviceInfo = {
+                "identifiers": {(domain, f"battery_{battery_manufacturer}_{battery_serial}")},
+                "manufacturer": battery_manufacturer or "GridSense",
+                "model": battery_model,
+                "name": battery_name,
+                "sw_version": battery.get("version"),
+                "via_device": inverter_identifier,
+            }
 
             for description in BATTERY_SENSORS:
                 entities.append(
@@ -251,34 +303,34 @@ async def async_setup_entry(
                         unique_id=f"battery_{battery_manufacturer}_{battery_serial}_{description.key}",
                         description=description,
                         device_info=battery_device,
-                        data_getter=lambda payload, inv_man=inverter_manufacturer, inv_serial=inverter_serial, bat_man=battery_manufacturer, bat_serial=battery_serial: _find_battery(
-                            payload, inv_man, inv_serial, bat_man, bat_serial
-                        ),
+                        data_getter=battery_getter,
                     )
                 )
 
         meter_index = 0
-        for meter in _find_meters_for_inverter(data, inverter_manufacturer, inverter_serial):
+        for list_index, meter in enumerate(meters.get(inverter_key) or []):
             if not _is_import_export_meter(meter):
                 continue
             meter_manufacturer = _identifier(meter.get("manufacturer"), "unknown_manufacturer")
-            meter_serial = _identifier(
-                meter.get("serialNumber"), f"{inverter_serial}_m{meter_index}"
-            )
+            meter_lookup_serial = _identifier(meter.get("serialNumber")) or None
+            meter_serial = meter_lookup_serial or f"{inverter_serial}_m{meter_index}"
             meter_index += 1
             meter_model = meter.get("model") or "Energy Meter"
             meter_name = _meter_name(
                 meter_manufacturer or "GridSense", meter_model, meter.get("options")
             )
 
-            meter_device = DeviceInfo(
-                identifiers={(DOMAIN, f"energymeter_{meter_manufacturer}_{meter_serial}")},
-                manufacturer=meter_manufacturer or "GridSense",
-                model=meter_model,
-                name=meter_name,
-                sw_version=meter.get("version"),
-                via_device=(DOMAIN, f"inverter_{inverter_manufacturer}_{inverter_serial}"),
+            meter_getter = _AttachedDeviceGetter(
+                "energyMeters", inverter_getter, meter_lookup_serial, list_index
             )
+            meter_device: DeviceInfo = {
+                "identifiers": {(domain, f"energymeter_{meter_manufacturer}_{meter_serial}")},
+                "manufacturer": meter_manufacturer or "GridSense",
+                "model": meter_model,
+                "name": meter_name,
+                "sw_version": meter.get("version"),
+                "via_device": inverter_identifier,
+            }
 
             for description in GRID_METER_SENSORS:
                 entities.append(
@@ -288,9 +340,7 @@ async def async_setup_entry(
                         unique_id=f"energymeter_{meter_manufacturer}_{meter_serial}_{description.key}",
                         description=description,
                         device_info=meter_device,
-                        data_getter=lambda payload, inv_man=inverter_manufacturer, inv_serial=inverter_serial, met_man=meter_manufacturer, met_serial=meter_serial: _find_meter(
-                            payload, inv_man, inv_serial, met_man, met_serial
-                        ),
+                        data_getter=meter_getter,
                     )
                 )
 
@@ -327,118 +377,81 @@ def _meter_name(manufacturer: str | None, model: str | None, options: Any) -> st
     return base
 
 
-def _try_float(value: Any) -> float | int | None:
-    """Convert a value to float when possible."""
-    if isinstance(value, (int, float)):
-        return value
-    if isinstance(value, str):
-        try:
-            return float(value)
-        except ValueError:
-            return None
-    return None
+class _InverterGetter:
+    """Return an inverter by manufacturer and serial.
+
+    The payload key seen at setup is tried first. When the device under it
+    no longer matches, the inverters are scanned once and the new key is
+    remembered.
+    """
+
+    __slots__ = ("inverter_key", "manufacturer", "serial")
 
+    def __init__(self, inverter_key: str, manufacturer: str, serial: str) -> None:
+        """Initialize the getter."""
+        self.inverter_key = inverter_key
+        self.manufacturer = manufacturer
+        self.serial = serial
 
-def _to_kwh(value: Any) -> float | None:
-    """Convert watt-hours to kiloWatt-hours."""
-    numeric = _try_float(value)
-    if numeric is None:
+    def __call__(self, payload: dict[str, Any]) -> dict[str, Any] | None:
+        """Return the inverter data from a coordinator payload."""
+        inverter_key = self.resolve_key(payload)
+        if inverter_key is None:
+            return None
+        return payload["inverters"][inverter_key]
+
+    def resolve_key(self, payload: dict[str, Any]) -> str | None:
+        """Return the payload key currently holding this inverter."""
+        inverters = payload.get("inverters") or _EMPTY
+        inverter = inverters.get(self.inverter_key)
+        if inverter is not None and self._matches(inverter):
+            return self.inverter_key
+        for inverter_key, inverter in inverters.items():
+            if self._matches(inverter):
+                self.inverter_key = inverter_key
+                return inverter_key
         return None
-    return numeric / 1000
 
+    def _matches(self, inverter: dict[str, Any]) -> bool:
+        """Return True if the inverter has this getter's manufacturer and serial."""
+        return (
+            _identifier(inverter.get("manufacturer"), "unknown_manufacturer") == self.manufacturer
+            and _identifier(inverter.get("serialNumber"), "unknown_serial") == self.serial
+        )
+
+
+class _AttachedDeviceGetter:
+    """Return a battery or meter attached to an inverter.
 
-def _to_percentage(value: Any) -> float | None:
-    """Return percentage value as provided by the API."""
-    numeric = _try_float(value)
-    if numeric is None:
+    Devices are matched on serial number; devices that reported no serial
+    at setup are matched on their list position instead.
+    """
+
+    __slots__ = ("index", "inverter_getter", "section", "serial")
+
+    def __init__(
+        self, section: str, inverter_getter: _InverterGetter, serial: str | None, index: int
+    ) -> None:
+        """Initialize the getter."""
+        self.section = section
+        self.inverter_getter = inverter_getter
+        self.serial = serial
+        self.index = index
+
+    def __call__(self, payload: dict[str, Any]) -> dict[str, Any] | None:
+        """Return the device data from a coordinator payload."""
+        inverter_key = self.inverter_getter.resolve_key(payload)
+        if inverter_key is None:
+            return None
+        devices = (payload.get(self.section) or _EMPTY).get(inverter_key) or ()
+        serial = self.serial
+        if serial is None:
+            index = self.index
+            return devices[index] if index < len(devices) else None
+        for device in devices:
+            if _identifier(device.get("serialNumber")) == serial:
+                return device
         return None
-    return numeric
-
-
-def _find_inverter(payload: dict[str, Any] | None, manufacturer: str, serial: str) -> dict[str, Any] | None:
-    """Find inverter by manufacturer and serial."""
-    for inverter in (payload or {}).get("inverters", {}).values():
-        if _identifier(inverter.get("manufacturer"), "unknown_manufacturer") == manufacturer and _identifier(
-            inverter.get("serialNumber"), "unknown_serial"
-        ) == serial:
-            return inverter
-    return None
-
-
-def _find_batteries_for_inverter(
-    payload: dict[str, Any] | None, inverter_manufacturer: str, inverter_serial: str
-) -> list[dict[str, Any]]:
-    """Return batteries attached to a given inverter."""
-    if payload is None:
-        return []
-    inverters = payload.get("inverters") or {}
-    batteries = payload.get("batteries") or {}
-    result: list[dict[str, Any]] = []
-
-    for inverter_key, battery_list in batteries.items():
-        inverter = inverters.get(inverter_key)
-        if inverter is None:
-            continue
-        if _identifier(inverter.get("manufacturer"), "unknown_manufacturer") != inverter_manufacturer or _identifier(
-            inverter.get("serialNumber"), "unknown_serial"
-        ) != inverter_serial:
-            continue
-        result.extend(battery_list or [])
-    return result
-
-
-def _find_battery(
-    payload: dict[str, Any] | None,
-    inverter_manufacturer: str,
-    inverter_serial: str,
-    battery_manufacturer: str,
-    battery_serial: str,
-) -> dict[str, Any] | None:
-    """Find battery matching inverter + manufacturer + serial."""
-    for battery in _find_batteries_for_inverter(payload, inverter_manufacturer, inverter_serial):
-        if _identifier(battery.get("manufacturer"), battery_manufacturer) == battery_manufacturer and _identifier(
-            battery.get("serialNumber"), battery_serial
-        ) == battery_serial:
-            return battery
-    return None
-
-
-def _find_meters_for_inverter(
-    payload: dict[str, Any] | None, inverter_manufacturer: str, inverter_serial: str
-) -> list[dict[str, Any]]:
-    """Return energy meters attached to a given inverter."""
-    if payload is None:
-        return []
-    inverters = payload.get("inverters") or {}
-    meters = payload.get("energyMeters") or {}
-    result: list[dict[str, Any]] = []
-
-    for inverter_key, meter_list in meters.items():
-        inverter = inverters.get(inverter_key)
-        if inverter is None:
-            continue
-        if _identifier(inverter.get("manufacturer"), "unknown_manufacturer") != inverter_manufacturer or _identifier(
-            inverter.get("serialNumber"), "unknown_serial"
-        ) != inverter_serial:
-            continue
-        result.extend(meter_list or [])
-    return result
-
-
-def _find_meter(
-    payload: dict[str, Any] | None,
-    inverter_manufacturer: str,
-    inverter_serial: str,
-    meter_manufacturer: str,
-    meter_serial: str,
-) -> dict[str, Any] | None:
-    """Find energy meter matching inverter + manufacturer + serial."""
-    for meter in _find_meters_for_inverter(payload, inverter_manufacturer, inverter_serial):
-        if _identifier(meter.get("manufacturer"), meter_manufacturer) == meter_manufacturer and _identifier(
-            meter.get("serialNumber"), meter_serial
-        ) == meter_serial:
-            return meter
-    return None
 
 
 def _is_import_export_meter(meter: dict[str, Any]) -> bool: